@@ -1,10 +1,11 @@
 """Command-line interface for myposition."""
 
 import argparse
+import os
 import sys
 from pathlib import Path
 
-from myposition.extract import Scanner
+from myposition import __version__
 
 
 class CLI:
@@ -16,6 +17,11 @@ class CLI:
             prog="myposition",
             description="Synthesize positions from conversations, notes, and documents",
         )
+        self.parser.add_argument(
+            "--version",
+            action="version",
+            version=f"%(prog)s {__version__}",
+        )
         subparsers = self.parser.add_subparsers(
             dest="command", help="Available commands"
         )
@@ -55,24 +61,38 @@ class CLI:
             args: Parsed command-line arguments
         """
         try:
+            # Imported lazily so help/error paths never pay the extract
+            # package's import cost (hashlib, validators, models).
+            from myposition.extract import Scanner
+
             scanner = Scanner(args.input_dir)
             result = scanner.scan()
 
-            # Print summary
-            print(f"\nScanning {args.input_dir} ...\n")
-            print(f"  conversations:  {len(result.conversations):>3} files")
-            print(f"  notes:          {len(result.notes):>3} files")
-            print(f"  documents:      {len(result.documents):>3} files")
+            # Result paths all live under the scanner's resolved input dir;
+            # stripping the prefix is much cheaper than Path.relative_to
+            # when thousands of paths get printed.
+            prefix = str(scanner.input_dir) + os.sep
+
+            # Buffer report lines and write them in one go; only the
+            # interactive misplaced prompts must hit stdout live.
+            buf: list[str] = []
+            buf.append(f"\nScanning {args.input_dir} ...\n\n")
+            buf.append(f"  conversations:  {len(result.conversations):>3} files\n")
+            buf.append(f"  notes:          {len(result.notes):>3} files\n")
+            buf.append(f"  documents:      {len(result.documents):>3} files\n")
 
             # Report misplaced files
             if result.misplaced:
-                print(f"\n⚠ Misplaced files ({len(result.misplaced)}):\n")
+                buf.append(f"\n⚠ Misplaced files ({len(result.misplaced)}):\n\n")
+                sys.stdout.write("".join(buf))
+                buf.clear()
                 for misplaced in result.misplaced:
-                    # Get file size for display
-                    size_kb = misplaced.path.stat().st_size / 1024
+                    # Size was captured during the scan; no re-stat needed
+                    size_kb = misplaced.size / 1024
+                    suggested_name = misplaced.suggested.value
                     print(
-                        f"  {misplaced.path.relative_to(args.input_dir)} "
-                        f"({size_kb:.1f} KiB) → suggested: {misplaced.suggested.value}/"
+                        f"  {str(misplaced.path).removeprefix(prefix)} "
+                        f"({size_kb:.1f} KiB) → suggested: {suggested_name}/"
                     )
                     response = input("  Move? [y/n/a(ll)/s(kip all)]: ").strip().lower()
 
@@ -88,22 +108,23 @@ class CLI:
                         # Move this file
                         self._move_file(
                             misplaced.path,
-                            args.input_dir / misplaced.suggested.value,
+                            args.input_dir / suggested_name,
                         )
 
             # Report duplicates
             if result.duplicates:
-                print(f"\n⚠ Duplicates ({len(result.duplicates)}):\n")
+                buf.append(f"\n⚠ Duplicates ({len(result.duplicates)}):\n\n")
                 for dup_path in result.duplicates:
-                    print(f"  {dup_path.relative_to(args.input_dir)}")
+                    buf.append(f"  {str(dup_path).removeprefix(prefix)}\n")
 
             # Report ignored files
             if result.ignored:
-                print(f"\n✗ Ignored ({len(result.ignored)}):\n")
+                buf.append(f"\n✗ Ignored ({len(result.ignored)}):\n\n")
                 for ignored_path in result.ignored:
-                    print(f"  {ignored_path.relative_to(args.input_dir)}")
+                    buf.append(f"  {str(ignored_path).removeprefix(prefix)}\n")
 
-            print()  # Final newline
+            buf.append("\n")  # Final newline
+            sys.stdout.write("".join(buf))
 
         except ValueError as e:
             print(f"Error: {e}", file=sys.stderr)
@@ -1,10 +1,23 @@
 """Data models for the extract layer."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 
+def _short_hash(content_hash: str) -> int:
+    """Derive a 64-bit dedup key from a content hash.
+
+    The first 16 hex chars of a SHA-256 digest; unique-size sentinels are
+    not hex, so they fall back to the built-in string hash. Collisions
+    are resolved by comparing the full content_hash.
+    """
+    try:
+        return int(content_hash[:16], 16)
+    except ValueError:
+        return hash(content_hash)
+
+
 class FileCategory(Enum):
     """File categories, ordered by deduplication priority (highest first)."""
 
@@ -18,33 +31,49 @@ CATEGORY_DIRS: dict[str, FileCategory] = {
     category.value: category for category in FileCategory
 }
 
+# Same pairs as a flat tuple for the scanner's traversal loop, skipping
+# dict-view iteration overhead
+CATEGORY_SUBDIRS: tuple[tuple[str, FileCategory], ...] = tuple(CATEGORY_DIRS.items())
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class FileMetadata:
     """Metadata for a validated file."""
 
     path: Path
     category: FileCategory
     size: int
-    content_hash: str  # SHA-256 hex digest
+    # SHA-256 hex digest, or a path-based sentinel when the file's unique
+    # size already proves it cannot be a duplicate
+    content_hash: str
+    # 64-bit truncation of content_hash: cheap int key for the dedup table
+    short_hash: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "short_hash", _short_hash(self.content_hash))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MisplacedFile:
     """A file that failed validation for its directory but passed for another."""
 
     path: Path
     placed_in: FileCategory
     suggested: FileCategory
+    size: int  # Carried from the scan stat so consumers don't re-stat
 
 
 @dataclass
 class CategorizationResult:
-    """Result of scanning and categorizing files in an input directory."""
+    """Result of scanning and categorizing files in an input directory.
+
+    Category collections are tuples: _deduplicate guarantees they hold no
+    duplicates, so there is no need to pay for set hashing.
+    """
 
-    conversations: frozenset[FileMetadata]
-    notes: frozenset[FileMetadata]
-    documents: frozenset[FileMetadata]
+    conversations: tuple[FileMetadata, ...]
+    notes: tuple[FileMetadata, ...]
+    documents: tuple[FileMetadata, ...]
     misplaced: list[MisplacedFile]
     duplicates: list[Path]
     ignored: list[Path]
@@ -1,19 +1,42 @@
 """Scanner for extracting and categorizing files from input directory."""
 
+import contextlib
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from myposition.extract.models import (
-    CATEGORY_DIRS,
+    CATEGORY_SUBDIRS,
     CategorizationResult,
     FileCategory,
     FileMetadata,
     MisplacedFile,
 )
 from myposition.extract.validators import (
-    ConversationValidator,
-    DocumentValidator,
     FileValidator,
-    NoteValidator,
+    _base_ok,
+    _validate_conversation,
+    _validate_document,
+    _validate_note,
+)
+
+# Specialized per-category predicates: plain functions avoid method
+# dispatch and super() chains in the per-file loop. The validator classes
+# remain the public per-path API.
+_VALIDATE_BY_CATEGORY = {
+    FileCategory.NOTE: _validate_note,
+    FileCategory.DOCUMENT: _validate_document,
+    FileCategory.CONVERSATION: _validate_conversation,
+}
+_VALIDATOR_PAIRS = tuple(_VALIDATE_BY_CATEGORY.items())
+
+# Whether files can be opened/stat'd relative to a directory fd, letting
+# the hashing phase skip a full pathname resolution per file.
+_HAS_DIR_FD = (
+    hasattr(os, "O_DIRECTORY")
+    and os.open in os.supports_dir_fd
+    and os.stat in os.supports_dir_fd
 )
 
 
@@ -29,7 +52,10 @@ class Scanner:
         Raises:
             ValueError: If input_dir doesn't exist or isn't a directory
         """
-        self.input_dir = input_dir.resolve()
+        # Lexical absolutization only: resolve() would additionally walk
+        # and stat every component for symlinks, which nothing here needs
+        # since files are stat'd/opened directly.
+        self.input_dir = Path(os.path.abspath(input_dir))
         if not self.input_dir.exists():
             msg = f"Input directory does not exist: {input_dir}"
             raise ValueError(msg)
@@ -37,13 +63,6 @@ class Scanner:
             msg = f"Input path is not a directory: {input_dir}"
             raise ValueError(msg)
 
-        # Initialize validators for each category
-        self._validators: dict[FileCategory, FileValidator] = {
-            FileCategory.NOTE: NoteValidator(),
-            FileCategory.DOCUMENT: DocumentValidator(),
-            FileCategory.CONVERSATION: ConversationValidator(),
-        }
-
     def scan(self) -> CategorizationResult:
         """Scan input directory and categorize files.
 
@@ -52,106 +71,170 @@ class Scanner:
             duplicates, and ignored files
         """
         # Temporary collections during scanning
-        categorized: dict[FileCategory, set[FileMetadata]] = {
-            FileCategory.CONVERSATION: set(),
-            FileCategory.NOTE: set(),
-            FileCategory.DOCUMENT: set(),
+        categorized: dict[FileCategory, list[FileMetadata]] = {
+            FileCategory.CONVERSATION: [],
+            FileCategory.NOTE: [],
+            FileCategory.DOCUMENT: [],
         }
         misplaced: list[MisplacedFile] = []
         ignored: list[Path] = []
+        validated: list[tuple[Path, FileCategory, int]] = []
 
-        # Scan each category subdirectory
-        for dir_name, category in CATEGORY_DIRS.items():
-            subdir = self.input_dir / dir_name
-            if not subdir.exists() or not subdir.is_dir():
-                continue
+        # Directory fds per category subdir so hashing opens files relative
+        # to them (one name lookup instead of a full path walk per file)
+        dir_fds: dict[Path, int] = {}
 
-            # Iterate over files (non-recursive)
-            for file_path in subdir.iterdir():
-                if not file_path.is_file():
+        # The try spans traversal and hashing so every opened fd is closed
+        # even if a later subdir's scan raises
+        hashes: dict[Path, str] = {}
+        try:
+            # Scan each category subdirectory
+            for dir_name, category in CATEGORY_SUBDIRS:
+                subdir = self.input_dir / dir_name
+                if not subdir.exists() or not subdir.is_dir():
                     continue
 
-                # Try validating with the expected category validator
-                validator = self._validators[category]
-                if validator.validate(file_path):
-                    # Success: hash file and create metadata
-                    content_hash = FileValidator.hash_file(file_path)
-                    metadata = FileMetadata(
-                        path=file_path,
-                        category=category,
-                        size=file_path.stat().st_size,
-                        content_hash=content_hash,
-                    )
-                    categorized[category].add(metadata)
-                else:
-                    # Failed: try other validators
-                    suggestions = self._find_alternate_category(file_path, category)
-                    if suggestions:
-                        # Exactly one alternate category passed
-                        # (or multiple, we just pick the first)
-                        suggested = suggestions[0]
-                        misplaced.append(
-                            MisplacedFile(
-                                path=file_path,
-                                placed_in=category,
-                                suggested=suggested,
+                if _HAS_DIR_FD:
+                    with contextlib.suppress(OSError):
+                        dir_fds[subdir] = os.open(subdir, os.O_RDONLY | os.O_DIRECTORY)
+
+                # The category's predicate is fixed for the whole subdir
+                check = _VALIDATE_BY_CATEGORY[category]
+
+                # Iterate over files (non-recursive). scandir's DirEntry
+                # caches is_file/stat results, so this costs no extra
+                # syscalls per file.
+                with os.scandir(subdir) as entries:
+                    for entry in entries:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                        file_path = Path(entry.path)
+                        suffix = file_path.suffix.lower()
+
+                        if not _base_ok(st, suffix):
+                            # Base checks fail for every category: ignore
+                            ignored.append(file_path)
+                            continue
+
+                        # Try validating with the expected category predicate
+                        if check(st, suffix):
+                            # Success: defer hashing so it can run in parallel
+                            validated.append((file_path, category, st.st_size))
+                        else:
+                            # Failed: try other predicates
+                            suggestions = self._find_alternate_category(
+                                st, suffix, category
                             )
+                            if suggestions:
+                                # Exactly one alternate category passed
+                                # (or multiple, we just pick the first)
+                                suggested = suggestions[0]
+                                misplaced.append(
+                                    MisplacedFile(
+                                        path=file_path,
+                                        placed_in=category,
+                                        suggested=suggested,
+                                        size=st.st_size,
+                                    )
+                                )
+                            else:
+                                # No alternate categories passed
+                                ignored.append(file_path)
+
+            # Hash only files that share a size: a file with a unique size
+            # cannot be a duplicate of anything, so it gets a sentinel
+            # instead of a read+hash. The rest hash in parallel:
+            # sha256 releases the GIL on the large buffers hash_file feeds
+            # it, so read+hash overlap across cores.
+            if validated:
+                size_counts = Counter(size for _, _, size in validated)
+                to_hash = [p for p, _, size in validated if size_counts[size] > 1]
+                max_workers = min(32, (os.cpu_count() or 4) * 2)
+
+                def hash_via_dir_fd(path: Path) -> str:
+                    return FileValidator.hash_file(
+                        path, dir_fd=dir_fds.get(path.parent)
+                    )
+
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    hashes = dict(
+                        zip(
+                            to_hash,
+                            executor.map(hash_via_dir_fd, to_hash),
+                            strict=True,
                         )
-                    else:
-                        # No alternate categories passed
-                        ignored.append(file_path)
+                    )
+        finally:
+            for fd in dir_fds.values():
+                os.close(fd)
+
+        for file_path, category, size in validated:
+            # Unhashed files get a path-based sentinel: guaranteed unique
+            # within the run regardless of how the size prefilter evolves
+            metadata = FileMetadata(
+                path=file_path,
+                category=category,
+                size=size,
+                content_hash=hashes.get(file_path, f"u:{file_path}"),
+            )
+            categorized[category].append(metadata)
 
         # Deduplicate by content hash
         deduped, duplicates = self._deduplicate(categorized)
 
         return CategorizationResult(
-            conversations=frozenset(deduped[FileCategory.CONVERSATION]),
-            notes=frozenset(deduped[FileCategory.NOTE]),
-            documents=frozenset(deduped[FileCategory.DOCUMENT]),
+            conversations=tuple(deduped[FileCategory.CONVERSATION]),
+            notes=tuple(deduped[FileCategory.NOTE]),
+            documents=tuple(deduped[FileCategory.DOCUMENT]),
             misplaced=misplaced,
             duplicates=duplicates,
             ignored=ignored,
         )
 
     def _find_alternate_category(
-        self, path: Path, skip_category: FileCategory
+        self, st: os.stat_result, suffix: str, skip_category: FileCategory
     ) -> list[FileCategory]:
         """Find alternate categories that would accept this file.
 
         Args:
-            path: File to validate
+            st: Pre-computed stat result for the file
+            suffix: Lowercased file extension
             skip_category: Category to skip (the one it was placed in)
 
         Returns:
             List of categories that pass validation (may be empty)
         """
         suggestions = []
-        for category, validator in self._validators.items():
+        for category, check in _VALIDATOR_PAIRS:
             if category == skip_category:
                 continue
-            if validator.validate(path):
+            if check(st, suffix):
                 suggestions.append(category)
         return suggestions
 
     def _deduplicate(
-        self, categorized: dict[FileCategory, set[FileMetadata]]
-    ) -> tuple[dict[FileCategory, set[FileMetadata]], list[Path]]:
+        self, categorized: dict[FileCategory, list[FileMetadata]]
+    ) -> tuple[dict[FileCategory, list[FileMetadata]], list[Path]]:
         """Deduplicate files across categories by content hash.
 
         Priority order: CONVERSATION > DOCUMENT > NOTE (first wins).
 
         Args:
-            categorized: Dict of category to FileMetadata sets
+            categorized: Dict of category to FileMetadata lists
 
         Returns:
             Tuple of (deduplicated categorized dict, list of duplicate paths)
         """
-        seen_hashes: dict[str, FileMetadata] = {}
+        # Keyed by 64-bit short_hash: int lookups are cheaper than hashing
+        # 64-char digest strings. Buckets hold colliding prefixes; a true
+        # duplicate must also match the full content_hash.
+        seen_hashes: dict[int, list[FileMetadata]] = {}
         duplicates: list[Path] = []
-        deduped: dict[FileCategory, set[FileMetadata]] = {
-            FileCategory.CONVERSATION: set(),
-            FileCategory.NOTE: set(),
-            FileCategory.DOCUMENT: set(),
+        deduped: dict[FileCategory, list[FileMetadata]] = {
+            FileCategory.CONVERSATION: [],
+            FileCategory.NOTE: [],
+            FileCategory.DOCUMENT: [],
         }
 
         # Process in priority order
@@ -163,12 +246,17 @@ class Scanner:
 
         for category in priority_order:
             for metadata in categorized[category]:
-                if metadata.content_hash in seen_hashes:
+                bucket = seen_hashes.get(metadata.short_hash)
+                if bucket is None:
+                    # First occurrence of this prefix
+                    seen_hashes[metadata.short_hash] = [metadata]
+                    deduped[category].append(metadata)
+                elif any(m.content_hash == metadata.content_hash for m in bucket):
                     # Duplicate detected
                     duplicates.append(metadata.path)
                 else:
-                    # First occurrence
-                    seen_hashes[metadata.content_hash] = metadata
-                    deduped[category].add(metadata)
+                    # Prefix collision, different content: keep it
+                    bucket.append(metadata)
+                    deduped[category].append(metadata)
 
         return deduped, duplicates
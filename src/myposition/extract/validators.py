@@ -1,10 +1,83 @@
 """File validators for the extract layer."""
 
 import hashlib
+import mmap
+import os
+import sqlite3
+import stat
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import ClassVar
 
+# Hot-loop constants live at module level so the validate predicates
+# compile to LOAD_GLOBAL instead of per-call attribute resolution.
+_ALLOWED_EXTS = frozenset({".md", ".markdown", ".txt"})
+_NOTE_MAX = 2048  # 2 KiB
+
+
+def _default_cache_path() -> Path:
+    """Resolve the hash-cache location, honoring MYPOSITION_CACHE_DIR."""
+    cache_dir = os.environ.get("MYPOSITION_CACHE_DIR")
+    if cache_dir is not None:
+        return Path(cache_dir) / "hashes.db"
+    return Path.home() / ".cache" / "myposition" / "hashes.db"
+
+
+# On-disk hash cache keyed by (path, mtime_ns, size): re-scans of an
+# unchanged corpus drop to stat-only cost. Opened lazily, shared across
+# Scanner's hashing threads behind a lock.
+_CACHE_PATH = _default_cache_path()
+_cache_lock = threading.Lock()
+_cache_conn: sqlite3.Connection | None = None
+_cache_unavailable = False
+
+
+def _base_ok(st: os.stat_result, suffix: str) -> bool:
+    """Base checks: regular file with an allowed (lowercased) extension."""
+    return stat.S_ISREG(st.st_mode) and suffix in _ALLOWED_EXTS
+
+
+def _validate_note(st: os.stat_result, suffix: str) -> bool:
+    """Note predicate: base checks + size constraint."""
+    return _base_ok(st, suffix) and st.st_size <= _NOTE_MAX
+
+
+def _validate_document(st: os.stat_result, suffix: str) -> bool:
+    """Document predicate: base checks only."""
+    return _base_ok(st, suffix)
+
+
+def _validate_conversation(st: os.stat_result, suffix: str) -> bool:
+    """Conversation predicate: base checks only."""
+    return _base_ok(st, suffix)
+
+
+def _hash_cache() -> sqlite3.Connection | None:
+    """Return the shared hash-cache connection, or None if unavailable.
+
+    Initialization runs entirely under the cache lock: the first callers
+    are the scanner's hashing threads, so an unlocked check could connect
+    twice or turn a concurrent CREATE TABLE failure into permanently
+    disabling the cache.
+    """
+    global _cache_conn, _cache_unavailable
+    with _cache_lock:
+        if _cache_conn is None and not _cache_unavailable:
+            try:
+                _CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(_CACHE_PATH, check_same_thread=False)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS hashes ("
+                    "path TEXT, mtime_ns INTEGER, size INTEGER, hash TEXT, "
+                    "PRIMARY KEY (path, mtime_ns, size))"
+                )
+                _cache_conn = conn
+            except (OSError, sqlite3.Error):
+                # Caching is an optimization; hashing must work without it.
+                _cache_unavailable = True
+        return _cache_conn
+
 
 class FileValidator(ABC):
     """Base validator for files.
@@ -12,20 +85,34 @@ class FileValidator(ABC):
     Subclasses add category-specific validation rules.
     """
 
-    ALLOWED_EXTENSIONS: ClassVar[frozenset[str]] = frozenset(
-        {".md", ".markdown", ".txt"}
-    )
+    ALLOWED_EXTENSIONS: ClassVar[frozenset[str]] = _ALLOWED_EXTS
+
+    # Above this size, hash via mmap so SHA-256 runs over the page cache
+    # in a single C call with no userspace copy.
+    MMAP_THRESHOLD: ClassVar[int] = 4 * 1024 * 1024  # 4 MiB
+
+    @staticmethod
+    def base_ok(path: Path, st: os.stat_result) -> bool:
+        """Run base checks against an already-fetched stat result.
+
+        Checks that the file is a regular file (not directory, symlink,
+        etc.) and has an allowed extension. Existence is implied by the
+        caller having obtained a stat result.
+
+        Args:
+            path: Path to the file to validate
+            st: Pre-computed stat result for path
+
+        Returns:
+            True if file passes base checks, False otherwise
+        """
+        return _base_ok(st, path.suffix.lower())
 
-    @abstractmethod
     def validate(self, path: Path) -> bool:
         """Validate that a file belongs to this category.
 
-        Base implementation checks:
-        - File exists
-        - Is a regular file (not directory, symlink, etc.)
-        - Has an allowed extension
-
-        Subclasses override to add category-specific rules.
+        Stats the file once and delegates to validate_stat, so category
+        checks never re-stat.
 
         Args:
             path: Path to the file to validate
@@ -33,31 +120,79 @@ class FileValidator(ABC):
         Returns:
             True if file passes validation, False otherwise
         """
-        if not path.exists():
+        try:
+            st = path.stat()
+        except OSError:
             return False
-        if not path.is_file():
-            return False
-        if path.suffix.lower() not in self.ALLOWED_EXTENSIONS:  # noqa: SIM103
-            return False
-        return True
+        return self.validate_stat(path, st)
+
+    @abstractmethod
+    def validate_stat(self, path: Path, st: os.stat_result) -> bool:
+        """Validate a file against a pre-computed stat result.
+
+        Base implementation runs the base checks. Subclasses override to
+        add category-specific rules.
+
+        Args:
+            path: Path to the file to validate
+            st: Pre-computed stat result for path
+
+        Returns:
+            True if file passes validation, False otherwise
+        """
+        return self.base_ok(path, st)
 
     @staticmethod
-    def hash_file(path: Path) -> str:
+    def hash_file(path: Path, *, dir_fd: int | None = None) -> str:
         """Compute SHA-256 hash of file contents.
 
-        Uses chunked reads to avoid loading entire file into memory.
+        Uses hashlib.file_digest, which reads and feeds the hash entirely
+        in C without loading the whole file into memory. Files above
+        MMAP_THRESHOLD are memory-mapped and hashed in one call instead.
+        Digests are cached on disk keyed by (path, mtime_ns, size) so
+        unchanged files are never re-hashed across runs.
 
         Args:
             path: Path to the file to hash
+            dir_fd: Open fd for path's directory. When given, stat and
+                open resolve just the file name relative to it, skipping
+                the full pathname walk.
 
         Returns:
             Hexadecimal SHA-256 digest
         """
-        sha256 = hashlib.sha256()
-        with path.open("rb") as f:
-            while chunk := f.read(8192):  # 8 KiB chunks
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        st = path.stat() if dir_fd is None else os.stat(path.name, dir_fd=dir_fd)
+        key = (str(path), st.st_mtime_ns, st.st_size)
+        conn = _hash_cache()
+        if conn is not None:
+            with _cache_lock:
+                row = conn.execute(
+                    "SELECT hash FROM hashes "
+                    "WHERE path = ? AND mtime_ns = ? AND size = ?",
+                    key,
+                ).fetchone()
+            if row is not None:
+                return row[0]
+
+        if dir_fd is None:
+            f = path.open("rb")
+        else:
+            f = os.fdopen(os.open(path.name, os.O_RDONLY, dir_fd=dir_fd), "rb")
+        with f:
+            if os.fstat(f.fileno()).st_size > FileValidator.MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    digest = hashlib.sha256(mm).hexdigest()
+            else:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+
+        if conn is not None:
+            with _cache_lock:
+                conn.execute(
+                    "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                    (*key, digest),
+                )
+                conn.commit()
+        return digest
 
 
 class NoteValidator(FileValidator):
@@ -66,20 +201,19 @@ class NoteValidator(FileValidator):
     Notes must be ≤ 2 KiB in size.
     """
 
-    NOTE_MAX_SIZE: ClassVar[int] = 2048  # 2 KiB
+    NOTE_MAX_SIZE: ClassVar[int] = _NOTE_MAX
 
-    def validate(self, path: Path) -> bool:
+    def validate_stat(self, path: Path, st: os.stat_result) -> bool:
         """Validate note file: base checks + size constraint.
 
         Args:
             path: Path to the file to validate
+            st: Pre-computed stat result for path
 
         Returns:
             True if file passes validation, False otherwise
         """
-        if not super().validate(path):
-            return False
-        return path.stat().st_size <= self.NOTE_MAX_SIZE
+        return _validate_note(st, path.suffix.lower())
 
 
 class DocumentValidator(FileValidator):
@@ -88,16 +222,17 @@ class DocumentValidator(FileValidator):
     Documents have no size constraint at file level.
     """
 
-    def validate(self, path: Path) -> bool:
+    def validate_stat(self, path: Path, st: os.stat_result) -> bool:
         """Validate document file: base checks only.
 
         Args:
             path: Path to the file to validate
+            st: Pre-computed stat result for path
 
         Returns:
             True if file passes validation, False otherwise
         """
-        return super().validate(path)
+        return _validate_document(st, path.suffix.lower())
 
 
 class ConversationValidator(FileValidator):
@@ -107,13 +242,14 @@ class ConversationValidator(FileValidator):
     Content-aware validation (multi-speaker detection) is deferred to Stage 2.
     """
 
-    def validate(self, path: Path) -> bool:
+    def validate_stat(self, path: Path, st: os.stat_result) -> bool:
         """Validate conversation file: base checks only.
 
         Args:
             path: Path to the file to validate
+            st: Pre-computed stat result for path
 
         Returns:
             True if file passes validation, False otherwise
         """
-        return super().validate(path)
+        return _validate_conversation(st, path.suffix.lower())
@@ -1,10 +1,30 @@
 """Main entry point for myposition CLI."""
 
-from myposition.cli import CLI
+import sys
+
+from myposition import __version__
 
 
 def main() -> None:
-    """Run the CLI."""
+    """Run the CLI.
+
+    Trivial invocations (no command, help, version) are answered before
+    importing the CLI stack, so they never pay for parser construction or,
+    transitively, the extract package.
+    """
+    if len(sys.argv) <= 1 or sys.argv[1] in {"-h", "--help", "--version"}:
+        if len(sys.argv) > 1 and sys.argv[1] == "--version":
+            print(f"myposition {__version__}")
+            return
+        # Help output comes from the real parser so it stays accurate;
+        # CLI construction is cheap and never touches extract.
+        from myposition.cli import CLI
+
+        CLI().parser.print_help()
+        return
+
+    from myposition.cli import CLI
+
     cli = CLI()
     cli.run()
 
@@ -1 +1,28 @@
 """Pytest configuration and shared fixtures."""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+
+from myposition.extract import validators
+
+
+@pytest.fixture(autouse=True)
+def isolated_hash_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Generator[None]:
+    """Point the on-disk hash cache at a per-test directory.
+
+    Keeps tests hermetic: nothing reads or writes the real user cache,
+    and no digest state leaks between tests. The env var also covers
+    subprocess-based e2e tests.
+    """
+    cache_dir = tmp_path / "hash-cache"
+    monkeypatch.setenv("MYPOSITION_CACHE_DIR", str(cache_dir))
+    monkeypatch.setattr(validators, "_CACHE_PATH", cache_dir / "hashes.db")
+    monkeypatch.setattr(validators, "_cache_conn", None)
+    monkeypatch.setattr(validators, "_cache_unavailable", False)
+    yield
+    if validators._cache_conn is not None:
+        validators._cache_conn.close()
@@ -72,6 +72,21 @@ class TestFileValidator:
 
         assert hash1 != hash2
 
+    def test_hash_file_cache_tracks_changes(self, tmp_path: Path) -> None:
+        """Test that re-hashing an unchanged/changed file stays correct."""
+        test_file = tmp_path / "file.md"
+        test_file.write_text("Original content")
+
+        first = FileValidator.hash_file(test_file)
+        repeat = FileValidator.hash_file(test_file)  # Cache hit path
+        assert first == repeat
+
+        # Different length so the (path, mtime_ns, size) cache key changes
+        # even on filesystems with coarse timestamps
+        test_file.write_text("Modified content, now longer")
+        changed = FileValidator.hash_file(test_file)
+        assert changed != first
+
 
 class TestNoteValidator:
     """Tests for NoteValidator."""
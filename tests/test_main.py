@@ -15,3 +15,14 @@ def test_main_no_args_shows_help() -> None:
         output = mock_stdout.getvalue()
         assert "myposition" in output.lower()
         assert "synthesize" in output.lower() or "extract" in output.lower()
+
+
+def test_main_version_fast_path() -> None:
+    """Test that --version prints version without touching extract."""
+    with patch("sys.stdout", new=StringIO()) as mock_stdout:
+        with patch("sys.argv", ["myposition", "--version"]):
+            main()
+
+        output = mock_stdout.getvalue()
+        assert "myposition" in output
+        assert any(char.isdigit() for char in output)